@@ -8,6 +8,8 @@ Simple authentication with OAuth.
 
 import json
 import os
+import stat
+import tempfile
 from pathlib import Path
 from typing import Any, Dict, Iterable, Mapping, Optional, Protocol, Tuple, Union
 
@@ -21,7 +23,6 @@ except ImportError:
     GOOGLE_AUTH_API_KEY_AVAILABLE = False
 from google.oauth2.credentials import Credentials as OAuthCredentials
 from google.oauth2.service_account import Credentials as SACredentials
-from google_auth_oauthlib.flow import InstalledAppFlow
 from requests import Session
 
 from .client import Client
@@ -107,6 +108,10 @@ def local_server_flow(
     Pass this function to ``flow`` parameter of :meth:`~gspread.oauth` to run
     a local server flow.
     """
+    # imported here as it pulls in oauthlib, which service account and
+    # API key users never need
+    from google_auth_oauthlib.flow import InstalledAppFlow
+
     flow = InstalledAppFlow.from_client_config(client_config, scopes)
     return flow.run_local_server(port=port)
 
@@ -126,8 +131,23 @@ def store_credentials(
     strip: str = "token",
 ) -> None:
     filename.parent.mkdir(parents=True, exist_ok=True)
-    with filename.open("w") as f:
-        f.write(creds.to_json(strip))
+    # write to a temporary file first so an interrupted write can't leave a
+    # truncated file behind, which would lose the refresh token and force
+    # a new OAuth flow on the next run.
+    # mkstemp gives a unique name only readable by the owner, an existing
+    # file keeps its own permissions.
+    fd, tmp_name = tempfile.mkstemp(
+        dir=filename.parent, prefix=filename.name, suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w") as f:
+            if filename.exists():
+                os.chmod(tmp_name, stat.S_IMODE(filename.stat().st_mode))
+            f.write(creds.to_json(strip))
+        os.replace(tmp_name, filename)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
 
 
 def oauth(
@@ -16,6 +16,8 @@ class Cell:
     in a :class:`~gspread.worksheet.Worksheet`.
     """
 
+    __slots__ = ("_row", "_col", "value", "__weakref__")
+
     def __init__(self, row: int, col: int, value: Optional[str] = "") -> None:
         self._row: int = row
         self._col: int = col
@@ -47,10 +49,14 @@ class Cell:
         if not isinstance(other, Cell):
             return False
 
-        same_row = self.row == other.row
-        same_col = self.col == other.col
-        same_value = self.value == other.value
-        return same_row and same_col and same_value
+        if self is other:
+            return True
+
+        return (self._row, self._col, self.value) == (
+            other._row,
+            other._col,
+            other.value,
+        )
 
     @property
     def row(self) -> int:
@@ -6,9 +6,10 @@ This module contains Client class responsible for managing spreadsheet files
 
 """
 
+import time
 from datetime import datetime
 from http import HTTPStatus
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Generator, List, Optional, Tuple, Union
 
 from google.auth.credentials import Credentials
 from requests import Response, Session
@@ -17,7 +18,13 @@ from .exceptions import APIError, SpreadsheetNotFound
 from .http_client import HTTPClient, HTTPClientType, ParamsType
 from .spreadsheet import Spreadsheet
 from .urls import DRIVE_FILES_API_V3_COMMENTS_URL, DRIVE_FILES_API_V3_URL
-from .utils import ExportFormat, MimeType, extract_id_from_url, finditem
+from .utils import (
+    ExportFormat,
+    MimeType,
+    drive_query_quote,
+    extract_id_from_url,
+    finditem,
+)
 
 
 class Client:
@@ -40,6 +47,12 @@ class Client:
     ) -> None:
         self.http_client = http_client(auth, session)
 
+        self._files_cache_ttl: float = 0
+        self._files_cache: Dict[
+            Tuple[Optional[str], Optional[str]],
+            Tuple[float, List[Dict[str, Any]], Response],
+        ] = {}
+
     @property
     def expiry(self) -> Optional[datetime]:
         """Returns the expiry date of the curenlty loaded credentials
@@ -65,6 +78,25 @@ class Client:
         """
         self.http_client.set_timeout(timeout)
 
+    def set_files_cache_ttl(self, ttl: float = 0) -> None:
+        """How long to keep the list of spreadsheet files in memory
+        and reuse it in :meth:`open`, :meth:`openall` and
+        :meth:`list_spreadsheet_files` instead of listing them again
+        using the Drive API.
+
+        Use value ``0`` to disable the cache (default).
+
+        Value for ``ttl`` is in seconds (s).
+
+        .. note::
+
+           The cache is cleared when a spreadsheet is created, copied
+           or deleted using this client. Changes made elsewhere
+           (like renaming a spreadsheet) are seen once the cache expires.
+        """
+        self._files_cache_ttl = ttl
+        self._files_cache.clear()
+
     def get_file_drive_metadata(self, id: str) -> Any:
         """Get the metadata from the Drive API for a specific file
         This method is mainly here to retrieve the create/update time
@@ -93,13 +125,20 @@ class Client:
     def _list_spreadsheet_files(
         self, title: Optional[str] = None, folder_id: Optional[str] = None
     ) -> Tuple[List[Dict[str, Any]], Response]:
+        cache_key = (title, folder_id)
+        if self._files_cache_ttl > 0 and cache_key in self._files_cache:
+            cached_at, cached_files, cached_response = self._files_cache[cache_key]
+            if time.monotonic() - cached_at < self._files_cache_ttl:
+                # callers may update the returned dicts, hand out copies
+                return [dict(f) for f in cached_files], cached_response
+
         files = []
         page_token = ""
         url = DRIVE_FILES_API_V3_URL
 
         query = f'mimeType="{MimeType.google_sheets}"'
         if title:
-            query += f' and name = "{title}"'
+            query += f' and name = "{drive_query_quote(title)}"'
         if folder_id:
             query += f' and parents in "{folder_id}"'
 
@@ -124,6 +163,13 @@ class Client:
             if page_token is None:
                 break
 
+        if self._files_cache_ttl > 0:
+            self._files_cache[cache_key] = (
+                time.monotonic(),
+                [dict(f) for f in files],
+                response,
+            )
+
         return files, response
 
     def open(self, title: str, folder_id: Optional[str] = None) -> Spreadsheet:
@@ -196,17 +242,26 @@ class Client:
 
         :returns: a list of :class:`~gspread.models.Spreadsheet` instances.
         """
-        spreadsheet_files = self.list_spreadsheet_files(title)
+        return list(self.iter_spreadsheets(title))
 
-        if title:
-            spreadsheet_files = [
-                spread for spread in spreadsheet_files if title == spread["name"]
-            ]
+    def iter_spreadsheets(
+        self, title: Optional[str] = None
+    ) -> Generator[Spreadsheet, None, None]:
+        """Iterates over all available spreadsheets.
+
+        Same as :meth:`openall` but each spreadsheet is opened (and its
+        metadata fetched) only when the iterator reaches it, so stopping
+        early saves the remaining requests.
 
-        return [
-            Spreadsheet(self.http_client, dict(title=x["name"], **x))
-            for x in spreadsheet_files
-        ]
+        :param str title: (optional) If specified can be used to filter
+            spreadsheets by title.
+
+        :returns: a generator of :class:`~gspread.spreadsheet.Spreadsheet` instances.
+        """
+        for spread in self.list_spreadsheet_files(title):
+            if title and title != spread["name"]:
+                continue
+            yield Spreadsheet(self.http_client, dict(title=spread["name"], **spread))
 
     def create(self, title: str, folder_id: Optional[str] = None) -> Spreadsheet:
         """Creates a new spreadsheet.
@@ -234,6 +289,7 @@ class Client:
         r = self.http_client.request(
             "post", DRIVE_FILES_API_V3_URL, json=payload, params=params
         )
+        self._files_cache.clear()
         spreadsheet_id = r.json()["id"]
         return self.open_by_key(spreadsheet_id)
 
@@ -318,6 +374,7 @@ class Client:
 
         params: ParamsType = {"supportsAllDrives": True}
         r = self.http_client.request("post", url, json=payload, params=params)
+        self._files_cache.clear()
         spreadsheet_id = r.json()["id"]
 
         new_spreadsheet = self.open_by_key(spreadsheet_id)
@@ -384,6 +441,7 @@ class Client:
 
         params: ParamsType = {"supportsAllDrives": True}
         self.http_client.request("delete", url, params=params)
+        self._files_cache.clear()
 
     def import_csv(self, file_id: str, data: Union[str, bytes]) -> Any:
         """Imports data into the first page of the spreadsheet.
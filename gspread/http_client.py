@@ -23,7 +23,7 @@ from typing import (
 )
 
 from google.auth.credentials import Credentials
-from google.auth.transport.requests import AuthorizedSession
+from google.auth.transport.requests import AuthorizedSession, Request
 from requests import Response, Session
 
 from .exceptions import APIError, UnSupportedExportFormat
@@ -81,11 +81,16 @@ class HTTPClient:
             self.auth: Credentials = convert_credentials(auth)
             self.session = AuthorizedSession(self.auth)
 
+            # Google APIs only compress responses when the user agent
+            # contains "gzip", the Accept-Encoding header is not enough.
+            # https://developers.google.com/sheets/api/guides/performance#gzip
+            self.session.headers["User-Agent"] = "{} (gzip)".format(
+                self.session.headers["User-Agent"]
+            )
+
         self.timeout: Optional[Union[float, Tuple[float, float]]] = None
 
     def login(self) -> None:
-        from google.auth.transport.requests import Request
-
         self.auth.refresh(Request(self.session))
 
         self.session.headers.update({"Authorization": "Bearer %s" % self.auth.token})
@@ -581,21 +586,22 @@ class BackOffHTTPClient(HTTPClient):
             error = err.error
 
             self._NR_BACKOFF += 1
-            wait = min(2**self._NR_BACKOFF, self._MAX_BACKOFF)
+            wait = 2**self._NR_BACKOFF
 
             # check if error should retry
             if _should_retry(code, error, wait) is True:
                 time.sleep(wait)
 
-                # make the request again
-                response = self.request(*args, **kwargs)
-
-                # reset counters for next time
-                self._NR_BACKOFF = 0
-
-                return response
+                try:
+                    # make the request again
+                    return self.request(*args, **kwargs)
+                finally:
+                    # reset counters for next time, even if the retry raised
+                    self._NR_BACKOFF = 0
 
-            # failed too many times, raise APIEerror
+            # not retryable or failed too many times, reset the counter
+            # for the next request and raise APIError
+            self._NR_BACKOFF = 0
             raise err
 
 
@@ -296,13 +296,12 @@ class Spreadsheet:
         :rtype: list
         """
         sheet_data = self.fetch_sheet_metadata()
-        worksheets = [
+        # skip hidden sheets before building the Worksheet objects
+        return [
             Worksheet(self, s["properties"], self.id, self.client)
             for s in sheet_data["sheets"]
+            if not (exclude_hidden and s["properties"].get("hidden", False))
         ]
-        if exclude_hidden:
-            worksheets = [w for w in worksheets if not w.isSheetHidden]
-        return worksheets
 
     def worksheet(self, title: str) -> Worksheet:
         """Returns a worksheet with specified `title`.
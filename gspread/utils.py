@@ -175,6 +175,10 @@ class TableDirection(StrEnum):
 
 
 def convert_credentials(credentials: Credentials) -> Credentials:
+    # google-auth credentials are the common case, return them as is
+    if isinstance(credentials, Credentials):
+        return credentials
+
     module = credentials.__module__
     cls = credentials.__class__.__name__
     if "oauth2client" in module and cls == "ServiceAccountCredentials":
@@ -185,8 +189,6 @@ def convert_credentials(credentials: Credentials) -> Credentials:
         "GoogleCredentials",
     ):
         return _convert_oauth(credentials)
-    elif isinstance(credentials, Credentials):
-        return credentials
 
     raise TypeError(
         "Credentials need to be from either oauth2client or from google-auth."
@@ -282,6 +284,11 @@ def numericise(
                 return value
             value = value.replace("_", "")
 
+        # blank cells are common, don't go through two failed conversions.
+        # checked after stripping underscores, as "_" is blank too
+        if value == "":
+            return 0 if empty2zero else default_blank
+
         # replace comma separating thousands to match python format
         cleaned_value = value.replace(",", "")
         try:
@@ -290,11 +297,7 @@ def numericise(
             try:
                 numericised = float(cleaned_value)
             except ValueError:
-                if value == "":
-                    if empty2zero:
-                        numericised = 0
-                    else:
-                        numericised = default_blank
+                pass
 
     return numericised
 
@@ -320,20 +323,21 @@ def numericise_all(
         numericising.
     """
     # in case someone explicitly passes `None` as ignored list
-    ignore = ignore or []
+    # use a set so the per-cell membership check stays O(1)
+    ignored = set(ignore or [])
 
     numericised_list = [
         (
-            values[index]
-            if index + 1 in ignore
+            value
+            if index in ignored
             else numericise(
-                values[index],
+                value,
                 empty2zero=empty2zero,
                 default_blank=default_blank,
                 allow_underscores_in_numeric_literals=allow_underscores_in_numeric_literals,
             )
         )
-        for index in range(len(values))
+        for index, value in enumerate(values, start=1)
     ]
 
     return numericised_list
@@ -611,6 +615,8 @@ def cast_to_a1_notation(method: Callable[..., T]) -> Callable[..., T]:
 
 
 def extract_id_from_url(url: str) -> str:
+    # the new-style "/spreadsheets/d/<key>" wins wherever it appears, even
+    # when a "key=" parameter comes first (e.g. in a redirect URL)
     m2 = URL_KEY_V2_RE.search(url)
     if m2:
         return m2.group(1)
@@ -710,6 +716,22 @@ def quote(value: str, safe: str = "", encoding: str = "utf-8") -> str:
     return uquote(value.encode(encoding), safe)
 
 
+def drive_query_quote(value: str) -> str:
+    r"""Escape a string value so it can be used inside a double quoted
+    string in a Drive API search query.
+
+    See https://developers.google.com/drive/api/guides/ref-search-terms
+
+    >>> drive_query_quote('My "new" sheet')
+    'My \\"new\\" sheet'
+
+    >>> drive_query_quote("back\\slash")
+    'back\\\\slash'
+    """
+    # escape backslashes first so the ones added for quotes are kept
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
 def absolute_range_name(sheet_name: str, range_name: Optional[str] = None) -> str:
     """Return an absolutized path of a range.
 
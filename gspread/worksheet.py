@@ -972,15 +972,18 @@ class Worksheet:
 
             # deal with named ranges
             named_ranges = spreadsheet_meta.get("namedRanges", [])
+            # look for a named range with the name range_name, in a single pass
+            ss_named_range = next(
+                (
+                    ss_namedRange
+                    for ss_namedRange in named_ranges
+                    if range_name is not None
+                    and ss_namedRange.get("name") == range_name
+                ),
+                None,
+            )
             # if there is a named range with the name range_name
-            if any(
-                range_name == ss_namedRange["name"]
-                for ss_namedRange in named_ranges
-                if ss_namedRange.get("name")
-            ):
-                ss_named_range = finditem(
-                    lambda x: x["name"] == range_name, named_ranges
-                )
+            if ss_named_range is not None:
                 grid_range = ss_named_range.get("range", {})
             # norrmal range_name, i.e., A1:B2
             elif range_name is not None:
@@ -2255,12 +2258,13 @@ class Worksheet:
 
         if isinstance(query, str):
             str_query = query
+            folded_query = query.casefold()
 
             def match(x: Cell) -> bool:
                 if case_sensitive or x.value is None:
                     return x.value == str_query
                 else:
-                    return x.value.casefold() == str_query.casefold()
+                    return x.value.casefold() == folded_query
 
         elif isinstance(query, re.Pattern):
             re_query = query
@@ -2280,29 +2284,32 @@ class Worksheet:
         values: Sequence[Sequence[Union[str, int, float]]],
         in_row: Optional[int] = None,
         in_column: Optional[int] = None,
-    ) -> List[Cell]:
-        """Returns a list of ``Cell`` instances scoped by optional
+    ) -> Iterator[Cell]:
+        """Returns an iterator of ``Cell`` instances scoped by optional
         ``in_row``` or ``in_column`` values (both one-based).
+
+        Cells are built lazily so :meth:`find` stops creating them
+        at the first match.
         """
         if in_row is not None and in_column is not None:
             raise TypeError("Either 'in_row' or 'in_column' should be specified.")
 
         if in_column is not None:
-            return [
+            return (
                 Cell(row=i + 1, col=in_column, value=str(row[in_column - 1]))
                 for i, row in enumerate(values)
-            ]
+            )
         elif in_row is not None:
-            return [
+            return (
                 Cell(row=in_row, col=j + 1, value=str(value))
                 for j, value in enumerate(values[in_row - 1])
-            ]
+            )
         else:
-            return [
+            return (
                 Cell(row=i + 1, col=j + 1, value=str(value))
                 for i, row in enumerate(values)
                 for j, value in enumerate(row)
-            ]
+            )
 
     def find(
         self,
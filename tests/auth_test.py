@@ -0,0 +1,70 @@
+import os
+import stat
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from gspread.auth import store_credentials
+
+
+def fake_credentials(content: str = '{"refresh_token": "new"}') -> mock.Mock:
+    creds = mock.Mock()
+    creds.to_json.return_value = content
+    return creds
+
+
+class StoreCredentialsTest(unittest.TestCase):
+    """Test for gspread.auth.store_credentials."""
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.dir = Path(tmp_dir.name, "gspread")
+        self.filename = self.dir / "authorized_user.json"
+
+    def test_store_new_file(self):
+        creds = fake_credentials()
+        store_credentials(creds, filename=self.filename)
+
+        creds.to_json.assert_called_once_with("token")
+        self.assertEqual(self.filename.read_text(), '{"refresh_token": "new"}')
+        self.assertEqual(os.listdir(self.dir), ["authorized_user.json"])
+
+    @unittest.skipIf(os.name == "nt", "POSIX file modes only")
+    def test_new_file_is_private(self):
+        store_credentials(fake_credentials(), filename=self.filename)
+        self.assertEqual(stat.S_IMODE(self.filename.stat().st_mode), 0o600)
+
+    @unittest.skipIf(os.name == "nt", "POSIX file modes only")
+    def test_existing_file_mode_is_kept(self):
+        self.dir.mkdir()
+        self.filename.write_text("{}")
+        os.chmod(self.filename, 0o640)
+
+        store_credentials(fake_credentials(), filename=self.filename)
+
+        self.assertEqual(stat.S_IMODE(self.filename.stat().st_mode), 0o640)
+        self.assertEqual(self.filename.read_text(), '{"refresh_token": "new"}')
+
+    def test_failed_write_keeps_old_file(self):
+        self.dir.mkdir()
+        self.filename.write_text('{"refresh_token": "old"}')
+        creds = fake_credentials()
+        creds.to_json.side_effect = ValueError("cannot serialize")
+
+        self.assertRaises(ValueError, store_credentials, creds, filename=self.filename)
+
+        self.assertEqual(self.filename.read_text(), '{"refresh_token": "old"}')
+        self.assertEqual(os.listdir(self.dir), ["authorized_user.json"])
+
+    def test_failed_replace_leaves_no_temporary_file(self):
+        with mock.patch("gspread.auth.os.replace", side_effect=OSError):
+            self.assertRaises(
+                OSError,
+                store_credentials,
+                fake_credentials(),
+                filename=self.filename,
+            )
+
+        self.assertEqual(os.listdir(self.dir), [])
@@ -1,9 +1,14 @@
+import copy
+import pickle
+import unittest
+import weakref
 from typing import Generator
 
 import pytest
 from pytest import FixtureRequest
 
 import gspread
+from gspread.cell import Cell
 from gspread.client import Client
 from gspread.spreadsheet import Spreadsheet
 from gspread.worksheet import Worksheet
@@ -193,3 +198,33 @@ class CellTest(GspreadTest):
 
         # make sure that no ranges were returned
         self.assertEqual(named_range_dict, {})
+
+
+class CellModelTest(unittest.TestCase):
+    """Test for gspread.Cell that don't need the API."""
+
+    def test_pickle_and_copy(self):
+        cell = Cell(2, 3, "value")
+        for clone in (pickle.loads(pickle.dumps(cell)), copy.copy(cell)):
+            self.assertIsNot(clone, cell)
+            self.assertEqual(clone, cell)
+            self.assertEqual((clone.row, clone.col, clone.value), (2, 3, "value"))
+
+    def test_equality(self):
+        cell = Cell(2, 3, "value")
+        self.assertEqual(cell, cell)
+        self.assertEqual(cell, Cell(2, 3, "value"))
+        self.assertNotEqual(cell, Cell(2, 3, "other"))
+        self.assertNotEqual(cell, Cell(3, 2, "value"))
+        self.assertNotEqual(cell, "value")
+
+    def test_weakref(self):
+        cell = Cell(1, 1)
+        self.assertIs(weakref.ref(cell)(), cell)
+
+    def test_no_extra_attributes(self):
+        cell = Cell(1, 1)
+        cell.value = "new"
+        self.assertEqual(cell.value, "new")
+        with self.assertRaises(AttributeError):
+            cell.note = "note"
@@ -1,5 +1,7 @@
 import time
-from typing import Generator
+import unittest
+from typing import Any, Generator
+from unittest import mock
 
 import pytest
 from pytest import FixtureRequest
@@ -8,7 +10,7 @@ import gspread
 from gspread.client import Client
 from gspread.spreadsheet import Spreadsheet
 
-from .conftest import GspreadTest
+from .conftest import DUMMY_ACCESS_TOKEN, DummyCredentials, GspreadTest
 
 
 class ClientTest(GspreadTest):
@@ -172,3 +174,121 @@ class ClientTest(GspreadTest):
         self.assertLessEqual(
             end - start, timeout, "Request took longer than the set timeout value"
         )
+
+
+def files_response(*names: str) -> Any:
+    """Build a fake Drive files.list response listing the given titles."""
+    response = mock.Mock()
+    response.json.return_value = {
+        "files": [{"id": "id-" + name, "name": name} for name in names]
+    }
+    return response
+
+
+class ClientFilesCacheTest(unittest.TestCase):
+    """Test for the spreadsheet files cache of gspread.client.Client."""
+
+    def setUp(self):
+        self.gc = Client(auth=DummyCredentials(DUMMY_ACCESS_TOKEN))
+        patcher = mock.patch.object(
+            self.gc.http_client, "request", return_value=files_response("a")
+        )
+        self.request = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_cache_disabled_by_default(self):
+        self.gc.list_spreadsheet_files()
+        self.gc.list_spreadsheet_files()
+        self.assertEqual(self.request.call_count, 2)
+
+    def test_cache_hit_within_ttl(self):
+        self.gc.set_files_cache_ttl(60)
+        first = self.gc.list_spreadsheet_files()
+        second = self.gc.list_spreadsheet_files()
+        self.assertEqual(self.request.call_count, 1)
+        self.assertEqual(first, second)
+
+    def test_cache_is_keyed_on_title_and_folder(self):
+        self.gc.set_files_cache_ttl(60)
+        self.gc.list_spreadsheet_files()
+        self.gc.list_spreadsheet_files(title="a")
+        self.gc.list_spreadsheet_files(folder_id="folder")
+        self.gc.list_spreadsheet_files(title="a")
+        self.assertEqual(self.request.call_count, 3)
+
+    def test_cache_expires(self):
+        self.gc.set_files_cache_ttl(60)
+        with mock.patch("gspread.client.time.monotonic", return_value=1000.0):
+            self.gc.list_spreadsheet_files()
+        with mock.patch("gspread.client.time.monotonic", return_value=1059.0):
+            self.gc.list_spreadsheet_files()
+        self.assertEqual(self.request.call_count, 1)
+        with mock.patch("gspread.client.time.monotonic", return_value=1060.0):
+            self.gc.list_spreadsheet_files()
+        self.assertEqual(self.request.call_count, 2)
+
+    def test_zero_ttl_disables_cache(self):
+        self.gc.set_files_cache_ttl(60)
+        self.gc.list_spreadsheet_files()
+        self.gc.set_files_cache_ttl(0)
+        self.gc.list_spreadsheet_files()
+        self.gc.list_spreadsheet_files()
+        self.assertEqual(self.request.call_count, 3)
+
+    def test_returned_files_are_copies(self):
+        self.gc.set_files_cache_ttl(60)
+        files = self.gc.list_spreadsheet_files()
+        # open() adds a "title" key to the dict it gets back
+        files[0]["title"] = files[0]["name"]
+        files[0]["name"] = "changed"
+        self.assertEqual(
+            self.gc.list_spreadsheet_files(), [{"id": "id-a", "name": "a"}]
+        )
+
+    def test_create_copy_and_delete_clear_cache(self):
+        self.gc.set_files_cache_ttl(60)
+        self.request.return_value.json.return_value["id"] = "new-id"
+
+        with mock.patch.object(Client, "open_by_key"):
+            for action in (
+                lambda: self.gc.create("b"),
+                lambda: self.gc.copy("id-a", title="b", copy_comments=False),
+                lambda: self.gc.del_spreadsheet("id-a"),
+            ):
+                self.gc.list_spreadsheet_files()
+                self.assertEqual(len(self.gc._files_cache), 1)
+                action()
+                self.assertEqual(self.gc._files_cache, {})
+
+
+class ClientIterSpreadsheetsTest(unittest.TestCase):
+    """Test for gspread.client.Client.iter_spreadsheets."""
+
+    def setUp(self):
+        self.gc = Client(auth=DummyCredentials(DUMMY_ACCESS_TOKEN))
+        patcher = mock.patch.object(
+            self.gc.http_client, "request", return_value=files_response("a", "b")
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @mock.patch("gspread.client.Spreadsheet")
+    def test_spreadsheets_are_opened_lazily(self, spreadsheet_cls):
+        spreadsheets = self.gc.iter_spreadsheets()
+        spreadsheet_cls.assert_not_called()
+
+        next(spreadsheets)
+        spreadsheet_cls.assert_called_once_with(
+            self.gc.http_client, {"title": "a", "id": "id-a", "name": "a"}
+        )
+
+        next(spreadsheets)
+        self.assertEqual(spreadsheet_cls.call_count, 2)
+        self.assertRaises(StopIteration, next, spreadsheets)
+
+    @mock.patch("gspread.client.Spreadsheet")
+    def test_title_filter(self, spreadsheet_cls):
+        self.assertEqual(len(list(self.gc.iter_spreadsheets(title="b"))), 1)
+        spreadsheet_cls.assert_called_once_with(
+            self.gc.http_client, {"title": "b", "id": "id-b", "name": "b"}
+        )
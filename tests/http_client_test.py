@@ -0,0 +1,85 @@
+import json
+import unittest
+from unittest import mock
+
+from requests import Response, Session
+
+from gspread.exceptions import APIError
+from gspread.http_client import BackOffHTTPClient, HTTPClient
+
+from .conftest import DUMMY_ACCESS_TOKEN, DummyCredentials
+
+
+class HTTPClientSessionTest(unittest.TestCase):
+    """Test for the session set up by gspread.http_client.HTTPClient."""
+
+    def test_user_agent_requests_gzip(self):
+        http_client = HTTPClient(DummyCredentials(DUMMY_ACCESS_TOKEN))
+        self.assertTrue(http_client.session.headers["User-Agent"].endswith("(gzip)"))
+
+    def test_custom_session_is_untouched(self):
+        session = Session()
+        user_agent = session.headers["User-Agent"]
+
+        http_client = HTTPClient(None, session=session)  # type: ignore
+
+        self.assertIs(http_client.session, session)
+        self.assertEqual(session.headers["User-Agent"], user_agent)
+
+
+def api_error(code: int) -> APIError:
+    response = Response()
+    response.status_code = code
+    response._content = json.dumps(
+        {"error": {"code": code, "message": "error", "status": "ERROR"}}
+    ).encode()
+    return APIError(response)
+
+
+class BackOffHTTPClientTest(unittest.TestCase):
+    """Test for gspread.http_client.BackOffHTTPClient."""
+
+    def setUp(self):
+        self.http_client = BackOffHTTPClient(DummyCredentials(DUMMY_ACCESS_TOKEN))
+
+        request_patcher = mock.patch.object(HTTPClient, "request")
+        self.request = request_patcher.start()
+        self.addCleanup(request_patcher.stop)
+
+        sleep_patcher = mock.patch("gspread.http_client.time.sleep")
+        self.sleep = sleep_patcher.start()
+        self.addCleanup(sleep_patcher.stop)
+
+    def sleeps(self):
+        return [call.args[0] for call in self.sleep.call_args_list]
+
+    def test_gives_up_after_max_backoff(self):
+        self.request.side_effect = api_error(429)
+
+        self.assertRaises(APIError, self.http_client.request, "get", "url")
+        self.assertEqual(self.sleeps(), [2, 4, 8, 16, 32, 64, 128])
+        self.assertEqual(self.request.call_count, 8)
+        self.assertEqual(self.http_client._NR_BACKOFF, 0)
+
+    def test_retry_then_success(self):
+        self.request.side_effect = [api_error(429), api_error(500), "response"]
+
+        self.assertEqual(self.http_client.request("get", "url"), "response")
+        self.assertEqual(self.sleeps(), [2, 4])
+        self.assertEqual(self.http_client._NR_BACKOFF, 0)
+
+    def test_non_retryable_error_resets_counter(self):
+        self.request.side_effect = [api_error(429), api_error(404)]
+
+        with self.assertRaises(APIError) as ctx:
+            self.http_client.request("get", "url")
+
+        self.assertEqual(ctx.exception.code, 404)
+        self.assertEqual(self.sleeps(), [2])
+        self.assertEqual(self.http_client._NR_BACKOFF, 0)
+
+    def test_counter_reset_when_retry_raises_other_error(self):
+        self.request.side_effect = [api_error(429), ConnectionError()]
+
+        self.assertRaises(ConnectionError, self.http_client.request, "get", "url")
+        self.assertEqual(self.http_client._NR_BACKOFF, 0)
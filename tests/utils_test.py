@@ -28,11 +28,33 @@ class UtilsTest(unittest.TestCase):
                 "ccc?key=1qpyC0X3A0MwQoFDE8p-Bll4hps&usp=drive_web#gid=0",
                 "1qpyC0X3A0MwQoFDE8p-Bll4hps",
             ),
+            (
+                "https://docs.google.com/spreadsheet/ccc?key=1qpyC0X3A0MwQoFDE8p-Bll4hps",
+                "1qpyC0X3A0MwQoFDE8p-Bll4hps",
+            ),
+            # New-style url with a trailing key parameter
+            (
+                "https://docs.google.com/spreadsheets/d/"
+                "1qpyC0X3A0MwQoFDE8p-Bll4hps/edit?key=0Bm-unrelated",
+                "1qpyC0X3A0MwQoFDE8p-Bll4hps",
+            ),
+            # key parameter before a new-style url, the new-style key wins
+            (
+                "https://example.org/?key=0Bm-unrelated&next="
+                "https://docs.google.com/spreadsheets/d/1qpyC0X3A0MwQoFDE8p-Bll4hps/edit",
+                "1qpyC0X3A0MwQoFDE8p-Bll4hps",
+            ),
         ]
 
         for url, id in url_id_list:
             self.assertEqual(id, utils.extract_id_from_url(url))
 
+    def test_drive_query_quote(self):
+        self.assertEqual(utils.drive_query_quote("Sheet 1"), "Sheet 1")
+        self.assertEqual(utils.drive_query_quote('My "new"'), 'My \\"new\\"')
+        self.assertEqual(utils.drive_query_quote("back\\slash"), "back\\\\slash")
+        self.assertEqual(utils.drive_query_quote('a\\"b'), 'a\\\\\\"b')
+
     def test_no_extract_id_from_url(self):
         self.assertRaises(
             gspread.NoValidUrlKeyFound, utils.extract_id_from_url, "http://example.org"
@@ -77,6 +99,22 @@ class UtilsTest(unittest.TestCase):
         self.assertEqual(utils.numericise("", default_blank="foo"), "foo")
         self.assertEqual(utils.numericise(""), "")
         self.assertEqual(utils.numericise(None), None)
+        self.assertEqual(
+            utils.numericise("_", allow_underscores_in_numeric_literals=True), ""
+        )
+        self.assertEqual(
+            utils.numericise(
+                "___", empty2zero=True, allow_underscores_in_numeric_literals=True
+            ),
+            0,
+        )
+        self.assertEqual(
+            utils.numericise(
+                "_", default_blank=None, allow_underscores_in_numeric_literals=True
+            ),
+            None,
+        )
+        self.assertEqual(utils.numericise("_"), "_")
 
         # test numericise_all
         inputs = ["1", "2", "3"]
@@ -96,6 +134,12 @@ class UtilsTest(unittest.TestCase):
         # provide explicit `None` as ignored list
         self.assertEqual(utils.numericise_all(inputs, ignore=None), expected)
 
+        # ignored indices are one-based, blanks follow empty2zero
+        self.assertEqual(
+            utils.numericise_all(["1", "2", "", "4"], empty2zero=True, ignore=[2, 4]),
+            [1, "2", 0, "4"],
+        )
+
     def test_a1_to_grid_range_simple(self):
         expected_single_dimension = {
             "startRowIndex": 0,